@@ -1,18 +1,31 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 # Global variables to store control points and state
+# Screen-space curves don't need more than float32 precision
 control_points = np.array([
     [1.0, 1.0],   # P0
     [2.0, 3.0],   # P1
     [4.0, 3.0],   # P2
     [5.0, 1.0]    # P3
-])
+], dtype=np.float32)
 
 # Variables for dragging functionality
 dragging_point = None
-point_circles = []
+
+# Artists that move while dragging, and the static background behind them
+# The control polygon and the curve share one LineCollection
+curve_lines = None
+point_scatter = None
+point_labels = []
+background = None
+
+# Set by mouse motion and cleared once the redraw timer has blitted the change,
+# so a burst of motion events collapses into a single repaint
+scene_dirty = False
 
 
 def de_casteljau(p0, p1, p2, p3, t):    
@@ -34,81 +47,158 @@ def de_casteljau(p0, p1, p2, p3, t):
     return b
 
 
-def generate_bezier_curve(p0, p1, p2, p3, num_points=100):
-    curve_points = []
+def precompute_coeffs(p0, p1, p2, p3):
+    # Expand the cubic Bernstein form into powers of t so it can be
+    # evaluated in Horner form: B(t) = ((A t + B) t + C) t + D
+    A = -p0 + 3 * p1 - 3 * p2 + p3
+    B = 3 * p0 - 6 * p1 + 3 * p2
+    C = -3 * p0 + 3 * p1
+    D = p0
     
-    # Generate points by varying t from 0 to 1
-    for i in range(num_points):
-        t = i / (num_points - 1)  # Parameter from 0 to 1
-        point = de_casteljau(p0, p1, p2, p3, t)
-        curve_points.append(point)
+    return A, B, C, D
+
+
+def generate_bezier_curve(p0, p1, p2, p3, num_points=100):
+    # Evaluate every t at once in Horner form (three multiply-adds per
+    # coordinate) instead of calling de_casteljau once per sample
+    # (kept above for reference)
+    A, B, C, D = precompute_coeffs(p0, p1, p2, p3)
+    t = np.linspace(0.0, 1.0, num_points, dtype=np.float32)[:, None]
     
-    return np.array(curve_points)
+    return ((A * t + B) * t + C) * t + D
 
 
 def draw_scene(ax):
+    global curve_lines, point_scatter
+    
     ax.clear()
     
-    # Extract control points for easier access
-    p0, p1, p2, p3 = control_points
+    # Artists that follow the control points are marked animated so they are
+    # left out of the cached background and blitted on top of it instead
     
-    # Draw the control polygon (straight lines connecting control points)
-    control_x = [p0[0], p1[0], p2[0], p3[0]]
-    control_y = [p0[1], p1[1], p2[1], p3[1]]
-    ax.plot(control_x, control_y, 'b--', linewidth=1, alpha=0.5, label='Control Polygon')
+    # Control polygon (dashed blue) and Bézier curve (solid red) in one collection
+    curve_lines = LineCollection([], colors=[(0, 0, 1, 0.5), 'r'], linestyles=['--', '-'],
+                                 linewidths=[1, 2], animated=True)
+    ax.add_collection(curve_lines, autolim=False)
     
-    # Generate and draw the Bézier curve
-    curve = generate_bezier_curve(p0, p1, p2, p3, num_points=100)
-    ax.plot(curve[:, 0], curve[:, 1], 'r-', linewidth=2, label='Bézier Curve')
-    
-    # Draw control points as circles
-    point_circles.clear()
-    colors = ['green', 'blue', 'blue', 'green']  # Endpoints in green, control points in blue
-    labels = ['P0', 'P1', 'P2', 'P3']
-    
-    for i, (point, color, label) in enumerate(zip(control_points, colors, labels)):
-        # Draw the point
-        circle = ax.plot(point[0], point[1], 'o', color=color, 
-                        markersize=10, picker=5)[0]
-        point_circles.append(circle)
-        
-        # Add label
-        ax.text(point[0], point[1] + 0.2, label, 
-               ha='center', fontsize=10, fontweight='bold')
+    # Draw control points as one scatter
+    # Endpoints in green, control points in blue
+    point_scatter = ax.scatter(control_points[:, 0], control_points[:, 1], s=10 ** 2, c=['green', 'blue', 'blue', 'green'],
+                               zorder=3, picker=5, animated=True)
+    
+    # Add labels
+    point_labels.clear()
+    for label in ['P0', 'P1', 'P2', 'P3']:
+        text = ax.text(0, 0, label, 
+                      ha='center', fontsize=10, fontweight='bold', animated=True)
+        point_labels.append(text)
+    
+    update_positions()
     
     # Set axis properties
     ax.set_xlim(0, 6)
     ax.set_ylim(0, 4)
     ax.set_aspect('equal')
     ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper right')
+    
+    # The collection has a single legend entry, so use proxy lines instead
+    ax.legend(handles=[
+        Line2D([], [], color='b', linestyle='--', linewidth=1, alpha=0.5, label='Control Polygon'),
+        Line2D([], [], color='r', linewidth=2, label='Bézier Curve')
+    ], loc='upper right')
     ax.set_title('Cubic Bézier Curve Playground', 
                 fontsize=12, fontweight='bold')
     ax.set_xlabel('x')
     ax.set_ylabel('y')
     
-    plt.draw()
+    ax.figure.canvas.draw_idle()
+
+
+def draw_animated_artists(ax):
+    ax.draw_artist(curve_lines)
+    ax.draw_artist(point_scatter)
+    for text in point_labels:
+        ax.draw_artist(text)
+
+
+def on_draw(event):
+    global background
+    
+    # savefig also emits draw_event, on a canvas that may not support
+    # copy_from_bbox and at a different dpi, so leave the background alone
+    if event.canvas.is_saving():
+        return
+    
+    # A full draw happened (first show, resize, structural change), so
+    # re-capture the static background and paint the moving artists over it
+    background = event.canvas.copy_from_bbox(ax.bbox)
+    draw_animated_artists(ax)
+
+
+def update_positions():
+    # Move the existing artists instead of rebuilding the whole axes
+    p0, p1, p2, p3 = control_points
+    curve = generate_bezier_curve(p0, p1, p2, p3, num_points=100)
+    
+    curve_lines.set_segments([control_points, curve])
+    point_scatter.set_offsets(control_points)
+    for point, text in zip(control_points, point_labels):
+        text.set_position((point[0], point[1] + 0.2))
+
+
+def update_scene(ax):
+    update_positions()
+    
+    # Fall back to a normal draw until the first background has been captured
+    canvas = ax.figure.canvas
+    if background is None:
+        canvas.draw_idle()
+        return
+    
+    # Restore the cached background, draw only the moving artists and blit
+    canvas.restore_region(background)
+    draw_animated_artists(ax)
+    canvas.blit(ax.bbox)
 
 
-def on_press(event):
+def on_pick(event):
     global dragging_point
     
-    if event.inaxes is None:
+    # The control point scatter has picker=5, so matplotlib's own hit test
+    # reports which points are under the click in event.ind
+    if event.artist is not point_scatter:
+        return
+    
+    # Picks also reach the axes for clicks just outside it, where the mouse
+    # event has no data coordinates
+    if event.mouseevent.inaxes is not ax:
+        return
+    
+    # Several points can fall inside the pick radius, so start dragging the
+    # one nearest to the cursor
+    candidates = np.asarray(event.ind)
+    cursor = np.array([event.mouseevent.xdata, event.mouseevent.ydata])
+    delta = control_points[candidates] - cursor
+    dragging_point = int(candidates[np.einsum('ij,ij->i', delta, delta).argmin()])
+    
+    # Only poll for pending redraws while a drag is in progress
+    redraw_timer.start()
+
+
+def flush_scene():
+    global scene_dirty
+    
+    # Called by the redraw timer: blit the latest control points if any
+    # motion happened since the last frame
+    if not scene_dirty:
         return
+    scene_dirty = False
     
-    # Check which point (if any) was clicked
-    for i, point in enumerate(control_points):
-        # Calculate distance from click to point
-        distance = np.sqrt((event.xdata - point[0])**2 + (event.ydata - point[1])**2)
-        
-        # If click is close enough to a point, start dragging it
-        if distance < 0.2:
-            dragging_point = i
-            break
+    update_scene(ax)
 
 
 def on_motion(event):
-    global dragging_point
+    global scene_dirty
     
     # Only process if we're dragging a point and mouse is in the axes
     if dragging_point is None or event.inaxes is None:
@@ -117,12 +207,17 @@ def on_motion(event):
     # Update the position of the dragged control point
     control_points[dragging_point] = [event.xdata, event.ydata]
     
-    # Redraw the scene with updated control points
-    draw_scene(event.inaxes)
+    # Leave the actual redraw to the timer so fast drags don't repaint on
+    # every single motion event
+    scene_dirty = True
 
 
 def on_release(event):
     global dragging_point
+    
+    # Show the final position even if the timer hasn't fired since the last move
+    flush_scene()
+    redraw_timer.stop()
     dragging_point = None
 
 
@@ -133,9 +228,15 @@ fig, ax = plt.subplots(figsize=(10, 6))
 draw_scene(ax)
 
 # Connect event handlers for interactivity
-fig.canvas.mpl_connect('button_press_event', on_press)
+fig.canvas.mpl_connect('draw_event', on_draw)
+fig.canvas.mpl_connect('pick_event', on_pick)
 fig.canvas.mpl_connect('motion_notify_event', on_motion)
 fig.canvas.mpl_connect('button_release_event', on_release)
 
+# Blit pending drag updates at most once every 8 ms (about 120 Hz)
+# Started by on_pick and stopped by on_release, so it is idle between drags
+redraw_timer = fig.canvas.new_timer(interval=8)
+redraw_timer.add_callback(flush_scene)
+
 # Show the interactive plot
 plt.show()
\ No newline at end of file
@@ -2,61 +2,23 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def de_casteljau_general(control_points, t):
-    points = [np.array(p) for p in control_points]
-    num_levels = len(points) - 1
-    
-    for level in range(num_levels):
-        next_level_points = []
-        for i in range(len(points) - 1):
-            new_point = (1 - t) * points[i] + t * points[i + 1]
-            next_level_points.append(new_point)
-        points = next_level_points
-    
-    return points[0]
-
-
-def generate_bezier_curve(control_points, num_points=100):
-    curve_points = []
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        point = de_casteljau_general(control_points, t)
-        curve_points.append(point)
-    return np.array(curve_points)
-
-
 def run_local_control_experiment(max_degree=15, vertical_shift=1.0, num_curve_points=100):
-    degrees = []
-    influence_percentages = []
+    # Shifting only P0_y by the vertical shift moves every curve point by
+    # shift * (1 - t)^degree, the Bernstein weight of P0, so the average
+    # displacement is the mean of that weight over the sampled t values.
+    # Every degree is independent, so the whole sweep is one broadcast:
+    # rows are degrees and columns are sample t values
+    degrees = np.arange(1, max_degree + 1)
+    t = np.linspace(0.0, 1.0, num_curve_points)
+    average_displacements = abs(vertical_shift) * np.mean((1 - t) ** degrees[:, None], axis=1)
+    
+    # Calculate what percentage of the original shift propagated to the average curve point
+    influence_percentages = (average_displacements / vertical_shift) * 100
     
-    for degree in range(1, max_degree + 1):
-        num_control_points = degree + 1
-        baseline_y = 2.0
-        control_points_original = []
-        
-        for i in range(num_control_points):
-            x = float(i)
-            y = baseline_y
-            control_points_original.append(np.array([x, y]))
-        
-        control_points_shifted = [np.array(p) for p in control_points_original]
-        control_points_shifted[0][1] += vertical_shift
-        
-        original_curve = generate_bezier_curve(control_points_original, num_curve_points)
-        shifted_curve = generate_bezier_curve(control_points_shifted, num_curve_points)
-        
-        vertical_displacements = np.abs(shifted_curve[:, 1] - original_curve[:, 1])
-        average_displacement = np.mean(vertical_displacements)
-        
-        # Calculate what percentage of the original shift propagated to the average curve point
-        influence_percentage = (average_displacement / vertical_shift) * 100
-        
-        degrees.append(degree)
-        influence_percentages.append(influence_percentage)
-        
+    for degree, influence_percentage in zip(degrees, influence_percentages):
         print(f"Degree {degree}: Average influence = {influence_percentage:.2f}% of P0 shift")
     
-    return degrees, influence_percentages
+    return degrees.tolist(), influence_percentages.tolist()
 
 
 def plot_results(degrees, influence_percentages):
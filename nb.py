@@ -1,19 +1,39 @@
+from math import comb
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.widgets import Button
 
 # Global variables to store control points and state
+# float32 is plenty for curves drawn at screen resolution
 # Start with cubic Bézier (degree 3 = 4 control points)
-control_points = [
-    np.array([1.0, 1.0]),
-    np.array([2.0, 3.0]),
-    np.array([4.0, 3.0]),
-    np.array([5.0, 1.0])
-]
+control_points = np.array([
+    [1.0, 1.0],
+    [2.0, 3.0],
+    [4.0, 3.0],
+    [5.0, 1.0]
+], dtype=np.float32)
 
 # Variables for dragging functionality
 dragging_point = None
-point_circles = []
+
+# Artists that move while dragging, and the static background behind them
+# They are created once by setup_scene and reused for every redraw
+# The control polygon and the curve share one LineCollection
+curve_lines = None
+point_scatter = None
+point_labels = []
+background = None
+
+# Set by mouse motion and cleared once the redraw timer has blitted the change,
+# so a burst of motion events collapses into a single repaint
+scene_dirty = False
+
+# Bernstein basis matrices keyed by (degree, num_points, dtype)
+# A new entry is only built when the degree buttons change the degree
+_BASIS_CACHE = {}
 
 # Store references to matplotlib objects
 fig = None
@@ -24,96 +44,85 @@ increase_button = None
 decrease_button = None
 
 
-def de_casteljau_general(control_points, t):
-    # Make a copy of control points to avoid modifying the original
-    # We'll work with this list and reduce it level by level
-    points = [np.array(p) for p in control_points]
-    
-    # Number of levels we need = number of control points - 1
-    # For cubic (4 points): 3 levels
-    # For quadratic (3 points): 2 levels
-    # For linear (2 points): 1 level
-    num_levels = len(points) - 1
-    
-    # Perform de Casteljau's algorithm level by level
-    for level in range(num_levels):
-        # Create a new list for the next level
-        next_level_points = []
-        
-        # The current level has (len(points)) points
-        # The next level will have (len(points) - 1) points
-        # We get each new point by linear interpolation between consecutive pairs
-        for i in range(len(points) - 1):
-            # Linear interpolation between points[i] and points[i+1]
-            # Formula: new_point = (1 - t) * point_a + t * point_b
-            new_point = (1 - t) * points[i] + t * points[i + 1]
-            next_level_points.append(new_point)
-        
-        # Move to the next level
-        points = next_level_points
-    
-    # After all levels, we should have exactly one point
-    # This is the point on the Bézier curve at parameter t
-    return points[0]
+def get_bernstein_basis(degree, num_points=100, dtype=np.float32):
+    # B[i, j] = C(n, j) * (1 - t_i)^(n - j) * t_i^j
+    # The basis only depends on the degree and the sample t values, so it is
+    # built once per degree and reused on every redraw
+    key = (degree, num_points, np.dtype(dtype))
+    if key not in _BASIS_CACHE:
+        t = np.linspace(0.0, 1.0, num_points)[:, None]
+        j = np.arange(degree + 1)
+        binomials = np.array([comb(degree, k) for k in j], dtype=float)
+        _BASIS_CACHE[key] = (binomials * (1 - t) ** (degree - j) * t ** j).astype(dtype)
+    
+    return _BASIS_CACHE[key]
 
 
 def generate_bezier_curve(control_points, num_points=100):
-    curve_points = []
-    
-    # Generate points by varying t from 0 to 1
-    for i in range(num_points):
-        t = i / (num_points - 1)  # Parameter from 0 to 1
-        point = de_casteljau_general(control_points, t)
-        curve_points.append(point)
-    
-    return np.array(curve_points)
+    # Evaluate every t at once as a single matrix product
+    return get_bernstein_basis(len(control_points) - 1, num_points).dot(control_points)
 
 
 def get_degree():
     return len(control_points) - 1
 
 
-def draw_scene():
-    ax.clear()
+def setup_scene():
+    global curve_lines, point_scatter
     
-    degree = get_degree()
+    # Artists that follow the control points are marked animated so they are
+    # left out of the cached background and blitted on top of it instead
     
-    # Draw the control polygon (straight lines connecting control points)
-    control_x = [p[0] for p in control_points]
-    control_y = [p[1] for p in control_points]
-    ax.plot(control_x, control_y, 'b--', linewidth=1, alpha=0.5, label='Control Polygon')
+    # Control polygon (dashed blue) and Bézier curve (solid red) in one collection
+    curve_lines = LineCollection([], colors=[(0, 0, 1, 0.5), 'r'], linestyles=['--', '-'],
+                                 linewidths=[1, 2], animated=True)
+    ax.add_collection(curve_lines, autolim=False)
     
-    # Generate and draw the Bézier curve
-    curve = generate_bezier_curve(control_points, num_points=100)
-    ax.plot(curve[:, 0], curve[:, 1], 'r-', linewidth=2, label=f'Bézier Curve (degree {degree})')
-    
-    # Draw control points as circles
-    point_circles.clear()
-    
-    for i, point in enumerate(control_points):
-        # Endpoints in green, internal control points in blue
-        if i == 0 or i == len(control_points) - 1:
-            color = 'green'
-            marker_size = 12
-        else:
-            color = 'blue'
-            marker_size = 10
-        
-        # Draw the point
-        circle = ax.plot(point[0], point[1], 'o', color=color, 
-                        markersize=marker_size, picker=5)[0]
-        point_circles.append(circle)
-        
-        # Add label showing the point index
-        ax.text(point[0], point[1] + 0.2, f'P{i}', 
-               ha='center', fontsize=10, fontweight='bold')
+    # All control points share a single scatter so a degree change only
+    # resizes its offsets, colors and sizes
+    point_scatter = ax.scatter([], [], zorder=3, picker=5, animated=True)
     
     # Set axis properties
     ax.set_xlim(0, 6)
     ax.set_ylim(0, 4)
     ax.set_aspect('equal')
     ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper right')
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+
+
+def sync_point_labels():
+    # Label i always reads P{i}, so the existing label artists are reused and
+    # only the ones needed when the number of control points changes are
+    # created or removed
+    while len(point_labels) < len(control_points):
+        text = ax.text(0, 0, f'P{len(point_labels)}', 
+                      ha='center', fontsize=10, fontweight='bold', animated=True)
+        point_labels.append(text)
+    while len(point_labels) > len(control_points):
+        point_labels.pop().remove()
+
+
+def draw_scene():
+    degree = get_degree()
+    
+    # Endpoints are larger and in green, internal control points in blue
+    colors = ['blue'] * len(control_points)
+    colors[0] = colors[-1] = 'green'
+    sizes = np.full(len(control_points), 10.0 ** 2)
+    sizes[[0, -1]] = 12.0 ** 2
+    
+    point_scatter.set_facecolor(colors)
+    point_scatter.set_edgecolor(colors)
+    point_scatter.set_sizes(sizes)
+    
+    sync_point_labels()
+    
+    # The collection has a single legend entry, so use proxy lines instead
+    ax.legend(handles=[
+        Line2D([], [], color='b', linestyle='--', linewidth=1, alpha=0.5, label='Control Polygon'),
+        Line2D([], [], color='r', linewidth=2, label=f'Bézier Curve (degree {degree})')
+    ], loc='upper right')
     
     # Create title with degree information
     degree_name = {
@@ -131,13 +140,60 @@ def draw_scene():
     ax.set_title(f'{curve_type} Bézier Curve ({len(control_points)} control points)\n' +
                 'Drag points to modify | Use buttons to change degree', 
                 fontsize=11, fontweight='bold')
-    ax.set_xlabel('x')
-    ax.set_ylabel('y')
     
-    plt.draw()
+    # Move the artists to the current control points and redraw everything
+    update_positions()
+    fig.canvas.draw_idle()
+
+
+def draw_animated_artists():
+    ax.draw_artist(curve_lines)
+    ax.draw_artist(point_scatter)
+    for text in point_labels:
+        ax.draw_artist(text)
+
+
+def on_draw(event):
+    global background
+    
+    # savefig also emits draw_event, on a canvas that may not support
+    # copy_from_bbox and at a different dpi, so leave the background alone
+    if event.canvas.is_saving():
+        return
+    
+    # A full draw happened (first show, resize, degree change), so
+    # re-capture the static background and paint the moving artists over it
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+    draw_animated_artists()
+
+
+def update_positions():
+    # Move the existing artists instead of rebuilding the whole axes
+    curve = generate_bezier_curve(control_points, num_points=100)
+    
+    curve_lines.set_segments([control_points, curve])
+    point_scatter.set_offsets(control_points)
+    for point, text in zip(control_points, point_labels):
+        text.set_position((point[0], point[1] + 0.2))
+
+
+def update_scene():
+    update_positions()
+    
+    # Fall back to a normal draw until the first background has been captured
+    if background is None:
+        fig.canvas.draw_idle()
+        return
+    
+    # Restore the cached background, draw only the moving artists and blit
+    fig.canvas.restore_region(background)
+    draw_animated_artists()
+    fig.canvas.blit(ax.bbox)
 
 
 def increase_degree(event):
+    global control_points
+    
     # Get the current last point
     last_point = control_points[-1]
     second_last_point = control_points[-2]
@@ -148,13 +204,15 @@ def increase_degree(event):
     new_point[1] += 0.5  # Offset upward slightly
     
     # Insert the new point before the last control point
-    control_points.insert(-1, new_point)
+    control_points = np.insert(control_points, len(control_points) - 1, new_point, axis=0)
     
     # Redraw the scene
     draw_scene()
 
 
 def decrease_degree(event):
+    global control_points
+    
     # Need at least 2 points for a curve (degree 1, linear)
     if len(control_points) <= 2:
         print("Cannot decrease degree below 1 (minimum 2 control points)")
@@ -162,45 +220,68 @@ def decrease_degree(event):
     
     # Remove the second-to-last control point
     # This keeps the endpoints intact
-    control_points.pop(-2)
+    control_points = np.delete(control_points, -2, axis=0)
     
     # Redraw the scene
     draw_scene()
 
-def on_press(event):
+def on_pick(event):
     global dragging_point
     
-    if event.inaxes != ax:
+    # The control point scatter has picker=5, so matplotlib's own hit test
+    # reports which points are under the click in event.ind
+    if event.artist is not point_scatter:
+        return
+    
+    # Picks also reach the axes for clicks just outside it, where the mouse
+    # event has no data coordinates
+    if event.mouseevent.inaxes is not ax:
         return
     
-    # Check which point (if any) was clicked
-    for i, point in enumerate(control_points):
-        # Calculate distance from click to point
-        distance = np.sqrt((event.xdata - point[0])**2 + (event.ydata - point[1])**2)
-        
-        # If click is close enough to a point, start dragging it
-        if distance < 0.2:
-            dragging_point = i
-            break
+    # Several points can fall inside the pick radius, so start dragging the
+    # one nearest to the cursor
+    candidates = np.asarray(event.ind)
+    cursor = np.array([event.mouseevent.xdata, event.mouseevent.ydata])
+    delta = control_points[candidates] - cursor
+    dragging_point = int(candidates[np.einsum('ij,ij->i', delta, delta).argmin()])
+    
+    # Only poll for pending redraws while a drag is in progress
+    redraw_timer.start()
+
+
+def flush_scene():
+    global scene_dirty
+    
+    # Called by the redraw timer: blit the latest control points if any
+    # motion happened since the last frame
+    if not scene_dirty:
+        return
+    scene_dirty = False
+    
+    update_scene()
 
 
 def on_motion(event):
-    global dragging_point
+    global scene_dirty
     
     # Only process if we're dragging a point and mouse is in the correct axes
     if dragging_point is None or event.inaxes != ax:
         return
     
     # Update the position of the dragged control point
-    control_points[dragging_point][0] = event.xdata
-    control_points[dragging_point][1] = event.ydata
+    control_points[dragging_point] = [event.xdata, event.ydata]
     
-    # Redraw the scene with updated control points
-    draw_scene()
+    # Leave the actual redraw to the timer so fast drags don't repaint on
+    # every single motion event
+    scene_dirty = True
 
 
 def on_release(event):
     global dragging_point
+    
+    # Show the final position even if the timer hasn't fired since the last move
+    flush_scene()
+    redraw_timer.stop()
     dragging_point = None
 
 # Create figure and main axis for the Bézier curve
@@ -209,7 +290,8 @@ fig = plt.figure(figsize=(12, 7))
 # Main plotting area (leave space at bottom for buttons)
 ax = plt.subplot2grid((10, 1), (0, 0), rowspan=9)
 
-# Draw initial scene
+# Create the artists once and draw the initial scene
+setup_scene()
 draw_scene()
 
 # Create button axes at the bottom
@@ -228,9 +310,15 @@ increase_button = Button(increase_button_ax, 'Increase Degree',
 increase_button.on_clicked(increase_degree)
 
 # Connect event handlers for interactivity
-fig.canvas.mpl_connect('button_press_event', on_press)
+fig.canvas.mpl_connect('draw_event', on_draw)
+fig.canvas.mpl_connect('pick_event', on_pick)
 fig.canvas.mpl_connect('motion_notify_event', on_motion)
 fig.canvas.mpl_connect('button_release_event', on_release)
 
+# Blit pending drag updates at most once every 8 ms (about 120 Hz)
+# Started by on_pick and stopped by on_release, so it is idle between drags
+redraw_timer = fig.canvas.new_timer(interval=8)
+redraw_timer.add_callback(flush_scene)
+
 # Show the interactive plot
 plt.show()
\ No newline at end of file
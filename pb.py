@@ -1,19 +1,40 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 from matplotlib.widgets import Button
 
 # Global variables to store control points and state
 # Start with one cubic Bézier curve (4 control points: P0, P1, P2, P3)
-control_points = [
-    np.array([1.0, 2.0]),   # P0
-    np.array([2.0, 3.5]),   # P1
-    np.array([3.0, 3.5]),   # P2
-    np.array([4.0, 2.0])    # P3
-]
+control_points = np.array([
+    [1.0, 2.0],   # P0
+    [2.0, 3.5],   # P1
+    [3.0, 3.5],   # P2
+    [4.0, 2.0]    # P3
+], dtype=np.float32)
 
 # Variables for dragging functionality
 dragging_point = None
-point_circles = []
+
+# Artists that move while dragging, and the static background behind them
+# They are created as needed and reused for every redraw
+# Every segment's control polygon and curve share one LineCollection
+segment_collection = None
+point_scatter = None
+point_labels = []
+background = None
+
+# Set by mouse motion and cleared once the redraw timer has blitted the change,
+# so a burst of motion events collapses into a single repaint
+scene_dirty = False
+pending_segments = set()
+
+# Power-basis coefficients (num_segments, 4, 2) and sampled curve points
+# (num_segments, num_points, 2) for every segment, reused until one of the
+# segment's control points moves
+segment_coeffs = None
+segment_curves = None
 
 # Store references to matplotlib objects
 fig = None
@@ -41,112 +62,202 @@ def de_casteljau(p0, p1, p2, p3, t):
     return b
 
 
-def generate_bezier_curve(p0, p1, p2, p3, num_points=100):
-    curve_points = []
+def precompute_coeffs(p0, p1, p2, p3):
+    # Expand the cubic Bernstein form into powers of t so it can be
+    # evaluated in Horner form: B(t) = ((A t + B) t + C) t + D
+    A = -p0 + 3 * p1 - 3 * p2 + p3
+    B = 3 * p0 - 6 * p1 + 3 * p2
+    C = -3 * p0 + 3 * p1
+    D = p0
     
-    # Generate points by varying t from 0 to 1
-    for i in range(num_points):
-        t = i / (num_points - 1)  # Parameter from 0 to 1
-        point = de_casteljau(p0, p1, p2, p3, t)
-        curve_points.append(point)
-    
-    return np.array(curve_points)
+    return A, B, C, D
 
 
 def get_num_segments():
     return (len(control_points) - 1) // 3
 
 
-def get_segment_control_points(segment_index):
-    # Each segment starts at index = segment_index * 3
-    # Segment 0: indices 0, 1, 2, 3
-    # Segment 1: indices 3, 4, 5, 6
-    # Segment 2: indices 6, 7, 8, 9
-    start_idx = segment_index * 3
+def get_segment_coeffs(segment_indices):
+    # Gather the control points of the requested segments into a
+    # (len(segment_indices), 4, 2) array and expand them all at once
+    point_indices = 3 * np.asarray(segment_indices)[:, None] + np.arange(4)
+    segments = control_points[point_indices]
     
-    p0 = control_points[start_idx]
-    p1 = control_points[start_idx + 1]
-    p2 = control_points[start_idx + 2]
-    p3 = control_points[start_idx + 3]
+    A, B, C, D = precompute_coeffs(segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3])
+    return np.stack([A, B, C, D], axis=1)
+
+
+def evaluate_segments(coeffs, num_points=100):
+    # Horner form broadcast over every segment: t has shape (1, num_points, 1)
+    # so each coefficient row (S, 1, 2) expands to (S, num_points, 2)
+    t = np.linspace(0.0, 1.0, num_points, dtype=np.float32)[None, :, None]
     
-    return p0, p1, p2, p3
+    return ((coeffs[:, 0:1] * t + coeffs[:, 1:2]) * t + coeffs[:, 2:3]) * t + coeffs[:, 3:4]
 
 
-def draw_scene():
-    ax.clear()
+def setup_scene():
+    global segment_collection, point_scatter
     
-    num_segments = get_num_segments()
+    # Artists that follow the control points are marked animated so they are
+    # left out of the cached background and blitted on top of it instead
+    segment_collection = LineCollection([], animated=True)
+    ax.add_collection(segment_collection, autolim=False)
     
+    # All control points share a single scatter
+    point_scatter = ax.scatter([], [], zorder=3, picker=5, animated=True)
+    
+    # Set axis properties
+    ax.set_ylim(0, 5)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+
+
+def style_segments():
     # Define colors for different segments
     segment_colors = ['red', 'green', 'blue', 'orange', 'purple', 'brown']
     
-    # Draw each cubic Bézier segment
-    for seg_idx in range(num_segments):
-        # Get control points for this segment
-        p0, p1, p2, p3 = get_segment_control_points(seg_idx)
-        
+    # The collection holds [polygon 0, curve 0, polygon 1, curve 1, ...], so
+    # each segment contributes a faint dashed polygon and a solid curve
+    colors = []
+    legend_handles = []
+    for seg_idx in range(get_num_segments()):
         # Choose color for this segment
         color = segment_colors[seg_idx % len(segment_colors)]
+        colors += [to_rgba(color, 0.3), color]
         
-        # Draw the control polygon for this segment
-        control_x = [p0[0], p1[0], p2[0], p3[0]]
-        control_y = [p0[1], p1[1], p2[1], p3[1]]
-        ax.plot(control_x, control_y, '--', color=color, 
-               linewidth=1, alpha=0.3, label=f'Control Polygon {seg_idx}')
-        
-        # Generate and draw the Bézier curve for this segment
-        curve = generate_bezier_curve(p0, p1, p2, p3, num_points=100)
-        ax.plot(curve[:, 0], curve[:, 1], '-', color=color, 
-               linewidth=2, label=f'Bézier Segment {seg_idx}')
-    
-    # Draw all control points as circles
-    point_circles.clear()
-    
-    for i, point in enumerate(control_points):
-        # Determine if this is a shared point (endpoint of one segment and start of next)
-        # Shared points occur at indices 3, 6, 9, ... (every 3rd point starting from index 3)
-        is_shared = (i > 0 and i % 3 == 0 and i < len(control_points) - 1)
-        
-        # Determine color based on point type
-        if i == 0 or i == len(control_points) - 1:
-            # First and last points (endpoints of entire piecewise curve)
-            color = 'darkgreen'
-            marker_size = 12
-        elif is_shared:
-            # Shared points between segments
-            color = 'red'
-            marker_size = 12
-        else:
-            # Regular control points
-            color = 'blue'
-            marker_size = 10
-        
-        # Draw the point
-        circle = ax.plot(point[0], point[1], 'o', color=color, 
-                        markersize=marker_size, picker=5)[0]
-        point_circles.append(circle)
-        
-        # Add label showing the point index
-        ax.text(point[0], point[1] + 0.15, f'P{i}', 
-               ha='center', fontsize=9, fontweight='bold')
+        # The collection has no per-segment legend entries, so use proxy lines
+        legend_handles.append(Line2D([], [], linestyle='--', color=color, linewidth=1,
+                                     alpha=0.3, label=f'Control Polygon {seg_idx}'))
+        legend_handles.append(Line2D([], [], color=color, linewidth=2,
+                                     label=f'Bézier Segment {seg_idx}'))
+    
+    segment_collection.set_color(colors)
+    segment_collection.set_linestyle(['--', '-'] * get_num_segments())
+    segment_collection.set_linewidth([1, 2] * get_num_segments())
+    
+    return legend_handles
+
+
+def sync_point_labels():
+    # Label i always reads P{i}, so only the labels for new points are created
+    for i in range(len(point_labels), len(control_points)):
+        text = ax.text(0, 0, f'P{i}', 
+                      ha='center', fontsize=9, fontweight='bold', animated=True)
+        point_labels.append(text)
+
+
+def get_affected_segments(point_index):
+    # Segment s uses control points 3s .. 3s + 3, so a point belongs to
+    # segment i // 3 and, if it is shared, also to the segment before it
+    num_segments = get_num_segments()
+    return {s for s in ((point_index - 1) // 3, point_index // 3) if 0 <= s < num_segments}
+
+
+def refresh_segment_curves(segment_indices=None):
+    global segment_coeffs, segment_curves
+    
+    # Without indices every segment is regenerated in one batch (used after
+    # structural changes); otherwise only the rows of the given segments are
+    # recomputed
+    if segment_indices is None:
+        segment_coeffs = get_segment_coeffs(np.arange(get_num_segments()))
+        segment_curves = evaluate_segments(segment_coeffs, num_points=100)
+        return
+    
+    segment_indices = sorted(segment_indices)
+    segment_coeffs[segment_indices] = get_segment_coeffs(segment_indices)
+    segment_curves[segment_indices] = evaluate_segments(segment_coeffs[segment_indices], num_points=100)
+
+
+def draw_scene():
+    num_segments = get_num_segments()
+    
+    legend_handles = style_segments()
+    sync_point_labels()
+    
+    # Determine color and size based on point type
+    colors = ['blue'] * len(control_points)
+    sizes = np.full(len(control_points), 10.0 ** 2)
+    
+    # Shared points between segments occur at indices 3, 6, 9, ...
+    # (every 3rd point starting from index 3)
+    colors[3:-1:3] = ['red'] * len(colors[3:-1:3])
+    sizes[3:-1:3] = 12.0 ** 2
+    
+    # First and last points (endpoints of entire piecewise curve)
+    colors[0] = colors[-1] = 'darkgreen'
+    sizes[[0, -1]] = 12.0 ** 2
+    
+    point_scatter.set_facecolor(colors)
+    point_scatter.set_edgecolor(colors)
+    point_scatter.set_sizes(sizes)
     
-    # Set axis properties
     # Dynamically adjust x-axis based on number of points
-    max_x = max(p[0] for p in control_points) + 1
+    max_x = control_points[:, 0].max() + 1
     ax.set_xlim(0, max(max_x, 6))
-    ax.set_ylim(0, 5)
-    ax.set_aspect('equal')
-    ax.grid(True, alpha=0.3)
-    ax.legend(loc='upper left', fontsize=8)
+    ax.legend(handles=legend_handles, loc='upper left', fontsize=8)
     ax.set_title(f'Piecewise Cubic Bézier Curve ({num_segments} segment{"s" if num_segments > 1 else ""})\n',
                 fontsize=11, fontweight='bold')
-    ax.set_xlabel('x')
-    ax.set_ylabel('y')
     
-    plt.draw()
+    # Move the artists to the current control points and redraw everything
+    refresh_segment_curves()
+    update_positions()
+    fig.canvas.draw_idle()
+
+
+def draw_animated_artists():
+    ax.draw_artist(segment_collection)
+    ax.draw_artist(point_scatter)
+    for text in point_labels:
+        ax.draw_artist(text)
+
+
+def on_draw(event):
+    global background
+    
+    # savefig also emits draw_event, on a canvas that may not support
+    # copy_from_bbox and at a different dpi, so leave the background alone
+    if event.canvas.is_saving():
+        return
+    
+    # A full draw happened (first show, resize, new segment), so
+    # re-capture the static background and paint the moving artists over it
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+    draw_animated_artists()
+
+
+def update_positions():
+    # Move the existing artists instead of rebuilding the whole axes
+    lines = []
+    for seg_idx in range(get_num_segments()):
+        lines.append(control_points[seg_idx * 3:seg_idx * 3 + 4])
+        lines.append(segment_curves[seg_idx])
+    segment_collection.set_segments(lines)
+    
+    point_scatter.set_offsets(control_points)
+    for point, text in zip(control_points, point_labels):
+        text.set_position((point[0], point[1] + 0.15))
+
+
+def update_scene():
+    update_positions()
+    
+    # Fall back to a normal draw until the first background has been captured
+    if background is None:
+        fig.canvas.draw_idle()
+        return
+    
+    # Restore the cached background, draw only the moving artists and blit
+    fig.canvas.restore_region(background)
+    draw_animated_artists()
+    fig.canvas.blit(ax.bbox)
 
 
 def add_segment(event):
+    global control_points
+    
     # Get the last control point (which will be shared with the new segment)
     last_point = control_points[-1]
     
@@ -164,49 +275,78 @@ def add_segment(event):
     new_p3 = last_point + np.array([3.0, 0.0])
     
     # Add the three new control points
-    control_points.append(new_p1)
-    control_points.append(new_p2)
-    control_points.append(new_p3)
+    control_points = np.concatenate([control_points, [new_p1, new_p2, new_p3]], dtype=np.float32)
     
     # Redraw the scene with the new segment
     draw_scene()
 
 
-def on_press(event):
+def on_pick(event):
     global dragging_point
     
-    if event.inaxes != ax:
+    # The control point scatter has picker=5, so matplotlib's own hit test
+    # reports which points are under the click in event.ind
+    if event.artist is not point_scatter:
         return
     
-    # Check which point (if any) was clicked
-    for i, point in enumerate(control_points):
-        # Calculate distance from click to point
-        distance = np.sqrt((event.xdata - point[0])**2 + (event.ydata - point[1])**2)
-        
-        # If click is close enough to a point, start dragging it
-        if distance < 0.2:
-            dragging_point = i
-            break
+    # Picks also reach the axes for clicks just outside it, where the mouse
+    # event has no data coordinates
+    if event.mouseevent.inaxes is not ax:
+        return
+    
+    # Several points can fall inside the pick radius, so start dragging the
+    # one nearest to the cursor
+    candidates = np.asarray(event.ind)
+    cursor = np.array([event.mouseevent.xdata, event.mouseevent.ydata])
+    delta = control_points[candidates] - cursor
+    dragging_point = int(candidates[np.einsum('ij,ij->i', delta, delta).argmin()])
+    
+    # Only poll for pending redraws while a drag is in progress
+    redraw_timer.start()
+
+
+def flush_scene():
+    global scene_dirty
+    
+    # Called by the redraw timer: blit the latest control points if any
+    # motion happened since the last frame
+    if not scene_dirty:
+        return
+    scene_dirty = False
+    
+    refresh_segment_curves(pending_segments)
+    pending_segments.clear()
+    update_scene()
 
 
 def on_motion(event):
-    global dragging_point
+    global scene_dirty
     
     # Only process if we're dragging a point and mouse is in the correct axes
     if dragging_point is None or event.inaxes != ax:
         return
     
     # Update the position of the dragged control point
-    control_points[dragging_point][0] = event.xdata
-    control_points[dragging_point][1] = event.ydata
+    control_points[dragging_point] = [event.xdata, event.ydata]
     
-    # Redraw the scene with updated control points
-    draw_scene()
+    # Only the segments that use the dragged point need new curve samples
+    pending_segments.update(get_affected_segments(dragging_point))
+    
+    # Leave the actual redraw to the timer so fast drags don't repaint on
+    # every single motion event
+    scene_dirty = True
 
 
 def on_release(event):
     global dragging_point
-    dragging_point = None
+    
+    # The x-axis range depends on the control points, so refresh the full
+    # scene once the drag is finished rather than on every motion event
+    if dragging_point is not None:
+        flush_scene()
+        redraw_timer.stop()
+        dragging_point = None
+        draw_scene()
 
 
 # Create figure and main axis for the Bézier curves
@@ -215,7 +355,8 @@ fig = plt.figure(figsize=(12, 7))
 # Main plotting area (leave space at bottom for button)
 ax = plt.subplot2grid((10, 1), (0, 0), rowspan=9)
 
-# Draw initial scene (one cubic Bézier curve)
+# Create the artists and draw initial scene (one cubic Bézier curve)
+setup_scene()
 draw_scene()
 
 # Create button axis at the bottom
@@ -227,9 +368,15 @@ add_button = Button(button_ax, 'Add Segment', color='lightblue', hovercolor='sky
 add_button.on_clicked(add_segment)
 
 # Connect event handlers for interactivity
-fig.canvas.mpl_connect('button_press_event', on_press)
+fig.canvas.mpl_connect('draw_event', on_draw)
+fig.canvas.mpl_connect('pick_event', on_pick)
 fig.canvas.mpl_connect('motion_notify_event', on_motion)
 fig.canvas.mpl_connect('button_release_event', on_release)
 
+# Blit pending drag updates at most once every 8 ms (about 120 Hz)
+# Started by on_pick and stopped by on_release, so it is idle between drags
+redraw_timer = fig.canvas.new_timer(interval=8)
+redraw_timer.add_callback(flush_scene)
+
 # Show the interactive plot
 plt.show()
\ No newline at end of file
@@ -1,66 +1,60 @@
+from math import comb
+
 import numpy as np
 import time
 
 
-def de_casteljau_general(control_points, t):
-    points = [np.array(p) for p in control_points]
-    num_levels = len(points) - 1
+def de_casteljau_batch(P, ts):
+    # Every t runs the same triangular reduction on the same control points,
+    # so run it for all of them at once: work holds one (n+1, 2) triangle
+    # level per t and each level is a single vectorized multiply-add
+    work = np.repeat(P[None], len(ts), axis=0)
+    t = np.asarray(ts, dtype=float)[:, None, None]
+    n = len(P) - 1
     
-    for level in range(num_levels):
-        next_level_points = []
-        for i in range(len(points) - 1):
-            new_point = (1 - t) * points[i] + t * points[i + 1]
-            next_level_points.append(new_point)
-        points = next_level_points
+    for k in range(n, 0, -1):
+        work[:, :k] += t * (work[:, 1:k + 1] - work[:, :k])
     
-    return points[0]
+    return work[:, 0]
 
 
-def de_casteljau_cubic(p0, p1, p2, p3, t):
-    # First level
-    q0 = (1 - t) * p0 + t * p1
-    q1 = (1 - t) * p1 + t * p2
-    q2 = (1 - t) * p2 + t * p3
-    
-    # Second level
-    r0 = (1 - t) * q0 + t * q1
-    r1 = (1 - t) * q1 + t * q2
-    
-    # Third level
-    b = (1 - t) * r0 + t * r1
-    
-    return b
+def bernstein_basis(degree, num_points=100, dtype=np.float64):
+    # B[i, j] = C(n, j) * (1 - t_i)^(n - j) * t_i^j, shape (num_points, n + 1)
+    t = np.linspace(0, 1, num_points)[:, None]
+    j = np.arange(degree + 1)
+    binomials = np.array([comb(degree, k) for k in j], dtype=float)
+    return (binomials * (1 - t) ** (degree - j) * t ** j).astype(dtype)
 
 
 def generate_higher_order_bezier(control_points, num_points=100):
-    curve_points = []
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        point = de_casteljau_general(control_points, t)
-        curve_points.append(point)
-    return np.array(curve_points)
+    P = np.asarray(control_points, dtype=float)
+    t = np.linspace(0, 1, num_points)
+    return de_casteljau_batch(P, t)
+
+
+def precompute_coeffs(p0, p1, p2, p3):
+    # Power-basis coefficients of the cubic: B(t) = ((A t + B) t + C) t + D
+    A = -p0 + 3 * p1 - 3 * p2 + p3
+    B = 3 * p0 - 6 * p1 + 3 * p2
+    C = -3 * p0 + 3 * p1
+    D = p0
+    return A, B, C, D
 
 
 def generate_piecewise_bezier(control_points, num_points=100):
     num_segments = (len(control_points) - 1) // 3
-    all_curve_points = []
+    P = np.asarray(control_points)
     
-    for seg_idx in range(num_segments):
-        start_idx = seg_idx * 3
-        p0 = control_points[start_idx]
-        p1 = control_points[start_idx + 1]
-        p2 = control_points[start_idx + 2]
-        p3 = control_points[start_idx + 3]
-        
-        segment_points = []
-        for i in range(num_points):
-            t = i / (num_points - 1)
-            point = de_casteljau_cubic(p0, p1, p2, p3, t)
-            segment_points.append(point)
-        
-        all_curve_points.extend(segment_points)
+    # (S, 4, 2) control points of every segment, expanded to (S, 4, 2)
+    # power-basis coefficients in one go
+    segments = P[3 * np.arange(num_segments)[:, None] + np.arange(4)]
+    coeffs = np.stack(precompute_coeffs(*segments.transpose(1, 0, 2)), axis=1)
     
-    return np.array(all_curve_points)
+    # Horner form broadcast over all segments with t shaped (1, N, 1)
+    t = np.linspace(0, 1, num_points)[None, :, None]
+    curves = ((coeffs[:, 0:1] * t + coeffs[:, 1:2]) * t + coeffs[:, 2:3]) * t + coeffs[:, 3:4]
+    
+    return curves.reshape(-1, 2)
 
 
 # Create 19 control points
@@ -86,23 +80,53 @@ num_curve_points = 100
 print(f"Running {num_iterations} iterations with {num_curve_points} points per curve...")
 print()
 
-# Time higher order Bézier
+# Time higher order Bézier (setup repeated inside every call)
 start_time = time.time()
 for _ in range(num_iterations):
     curve = generate_higher_order_bezier(control_points, num_curve_points)
 end_time = time.time()
 higher_order_time = end_time - start_time
 
-# Time piecewise Bézier
+# Time piecewise Bézier (setup repeated inside every call)
 start_time = time.time()
 for _ in range(num_iterations):
     curve = generate_piecewise_bezier(control_points, num_curve_points)
 end_time = time.time()
 piecewise_time = end_time - start_time
 
+# Build everything that doesn't depend on the iteration once, so the loops
+# below only measure the curve evaluation itself. This is done for both
+# float64 and float32 to compare the two widths
+num_segments = (num_control_points - 1) // 3
+precomputed_times = {}
+
+for dtype in (np.float64, np.float32):
+    P = np.asarray(control_points, dtype=dtype)
+    B_high = bernstein_basis(num_control_points - 1, num_curve_points, dtype=dtype)
+    B_cubic = bernstein_basis(3, num_curve_points, dtype=dtype)
+    segs = np.stack([P[i * 3:i * 3 + 4] for i in range(num_segments)])
+    
+    # Time higher order Bézier with a precomputed basis
+    start_time = time.time()
+    for _ in range(num_iterations):
+        curve = B_high @ P
+    end_time = time.time()
+    higher_order_precomputed_time = end_time - start_time
+    
+    # Time piecewise Bézier with a precomputed basis and stacked segments
+    start_time = time.time()
+    for _ in range(num_iterations):
+        # Same contraction as einsum('tj,sjd->std'), but matmul broadcasts over
+        # the segments with far less per-call overhead
+        curve = (B_cubic @ segs).reshape(-1, 2)
+    end_time = time.time()
+    piecewise_precomputed_time = end_time - start_time
+    
+    precomputed_times[np.dtype(dtype).name] = (higher_order_precomputed_time, piecewise_precomputed_time)
+
 # Results
 print("=" * 70)
-print("RESULTS")
+print("RESULTS (setup repeated every iteration)")
 print("=" * 70)
 print(f"Higher Order Bézier (Degree {num_control_points - 1}):")
 print(f"  Total time: {higher_order_time:.4f} seconds")
@@ -116,6 +140,21 @@ print(f"Speed ratio: {higher_order_time / piecewise_time:.2f}x")
 print(f"Piecewise is {((higher_order_time - piecewise_time) / higher_order_time * 100):.1f}% faster")
 print()
 
+for dtype_name, (higher_order_precomputed_time, piecewise_precomputed_time) in precomputed_times.items():
+    print("=" * 70)
+    print(f"RESULTS (basis and control arrays precomputed, {dtype_name})")
+    print("=" * 70)
+    print(f"Higher Order Bézier (Degree {num_control_points - 1}):")
+    print(f"  Total time: {higher_order_precomputed_time:.4f} seconds")
+    print(f"  Average per iteration: {(higher_order_precomputed_time / num_iterations) * 1000:.4f} ms")
+    print()
+    print(f"Piecewise Bézier ({num_segments} cubic segments):")
+    print(f"  Total time: {piecewise_precomputed_time:.4f} seconds")
+    print(f"  Average per iteration: {(piecewise_precomputed_time / num_iterations) * 1000:.4f} ms")
+    print()
+    print(f"Speed ratio: {higher_order_precomputed_time / piecewise_precomputed_time:.2f}x")
+    print()
+
 # Complexity analysis
 higher_order_ops = (num_control_points * (num_control_points - 1)) // 2  # n(n-1)/2
 piecewise_ops = 6 * ((num_control_points - 1) // 3)  # 6n for cubic segments